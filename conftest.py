@@ -4,6 +4,17 @@ from typing import Any, Generator
 import p1_data_client_python.helpers.dbg as dbg
 import p1_data_client_python.helpers.unit_test as hut
 
+# The live tests call the servers and the notebooks, so they are slow and need
+# API tokens. By default only the mocked tests run: set `P1_RUN_LIVE_TESTS=1`
+# to run the live ones too.
+collect_ignore = []
+if not os.environ.get("P1_RUN_LIVE_TESTS"):
+    collect_ignore = [
+        "test/test_client.py",
+        "test/test_client_jupyter.py",
+        "test/test_edgar_client.py",
+    ]
+
 # Add custom options.
 
 # Hack to workaround pytest not happy with multiple redundant conftest.py
@@ -3,6 +3,8 @@
 # #############################################################################
 
 # Run fast tests.
+# The tests wait mostly on the server, so spread them over the workers, each
+# one with its own clients. The tests of an `xdist_group` stay on one worker.
 fast_test_gh_actions:
 	PYTHONPATH=$(shell pwd):$(shell pwd)/p1_data_client_python \
-	pytest -vv
+	pytest -vv -n auto --dist=loadgroup
@@ -0,0 +1,15 @@
+# #############################################################################
+# Release
+# #############################################################################
+
+# Build the sdist and the wheel. PyPI serves the metadata of uploaded wheels
+# on its own (PEP 658), so that resolvers read the dependencies without
+# downloading the wheel.
+build_package:
+	rm -rf dist build && \
+	python -m build --sdist --wheel
+
+# Upload the package to PyPI.
+upload_package: build_package
+	python -m twine check dist/* && \
+	python -m twine upload dist/*
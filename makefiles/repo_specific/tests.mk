@@ -1,6 +1,6 @@
 # #############################################################################
 # Tests
 # #############################################################################
-# Run fast tests.
+# Run fast tests in parallel, keeping each `xdist_group` on one worker.
 fast_test:
-	pytest -vv
+	pytest -vv -n auto --dist=loadgroup
@@ -6,11 +6,14 @@ import p1_data_client_python.abstract_client as pabstr
 """
 
 import abc
+import collections
 import datetime as dt
 import json
 import platform
+import threading
+import time
 import tqdm
-from typing import Any, Dict
+from typing import Any, Deque, Dict, Optional
 
 import pandas as pd
 import requests
@@ -20,6 +23,56 @@ import requests.packages.urllib3.util.retry as rq_retry
 import p1_data_client_python.exceptions as p1_exc
 import p1_data_client_python.version as version
 
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter of the number of requests per second.
+    """
+
+    def __init__(self, rps: float):
+        """
+        :param rps: Max number of requests per second. Rates below 1 allow
+            one request every `1 / rps` seconds.
+        """
+        if not rps > 0:
+            raise ValueError(
+                f"The number of requests per second must be > 0: {rps}"
+            )
+        self.rps = rps
+        # Allow `max_requests` requests in any window of `window` seconds.
+        self._max_requests = max(1, int(rps))
+        self._window = self._max_requests / rps
+        self._lock = threading.Lock()
+        self._timestamps: Deque[float] = collections.deque()
+
+    def acquire(self) -> None:
+        """
+        Block until a new request can be sent without exceeding the limit.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # Forget the requests sent before the current window.
+                while (
+                    self._timestamps
+                    and now - self._timestamps[0] >= self._window
+                ):
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self._max_requests:
+                    self._timestamps.append(now)
+                    return
+                wait = self._window - (now - self._timestamps[0])
+            # Sleep without holding the lock, so that the other threads can
+            # check the limit meanwhile, then try again.
+            time.sleep(wait)
+
 
 class AbstractClient:
     """
@@ -33,23 +86,42 @@ class AbstractClient:
         use_retries: bool = True,
         retries_number: int = 5,
         backoff_factor: float = 0.3,
+        requests_per_second: Optional[float] = None,
+        pool_size: int = 16,
     ):
         """
         Pass arguments and gets authenticated in the system.
 
         :param base_url: REST API Server url.
         :param token: Your token for access to the system.
+        :param requests_per_second: Max number of requests per second sent
+            to the server, shared by all the threads of the client (e.g., the
+            concurrent page requests of `EdgarClient`). None (default) means
+            no limit.
+        :param pool_size: Max number of connections to the server kept
+            alive for reuse.
         """
         self.base_url = base_url or self._default_base_url
         self.base_url = self.base_url.rstrip("//")
+        # The routes are constant, so build their full urls once.
+        self._urls = {
+            name: f"{self.base_url}{route}"
+            for name, route in self._api_routes.items()
+        }
         self.token = token
         self.use_retries = use_retries
         self.retries_number = retries_number
         self.backoff_factor = backoff_factor
+        self.pool_size = pool_size
         self._scroll_id = ""
-        self.status_forcelist = (500, 502, 504)
+        # Retries of 429 and 503 wait for the `Retry-After` header of the
+        # server when it's set.
+        self.status_forcelist = (429, 500, 502, 503, 504)
         self._last_search_parameters = None
         self.session = self._get_session()
+        self._rate_limiter: Optional[RateLimiter] = None
+        if requests_per_second is not None:
+            self._rate_limiter = RateLimiter(requests_per_second)
         self.headers = {
             "Authorization": "Token " + self.token,
             "Content-Type": "application/json",
@@ -104,14 +176,66 @@ class AbstractClient:
         :param response: Response from a request.
         :return: Dataframe from json.
         """
+        body = cls._get_response_body(response, "data")
+        return cls._get_dataframe_from_body(body)
+
+    @staticmethod
+    def _get_dataframe_from_body(body: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Retrieve the dataframe from an already decoded response body.
+
+        :param body: Decoded json of a response.
+        :return: Dataframe from json.
+        """
         try:
-            data = pd.DataFrame(response.json()["data"])
-        except (KeyError, json.JSONDecodeError) as e:
+            data = pd.DataFrame(body["data"])
+        except KeyError as e:
             raise p1_exc.ParseResponseException(
                 "Can't transform server response to a pandas Dataframe"
             ) from e
         return data
 
+    @staticmethod
+    def _get_json(response: requests.Response) -> Any:
+        """
+        Decode the json body of a response.
+
+        Use `orjson` if it's installed, since it's much faster than the
+        standard library on large payloads.
+
+        :param response: Response from a request.
+        :return: Decoded json.
+        """
+        return _json_loads(response.content)
+
+    @classmethod
+    def _get_response_body(
+        cls, response: requests.Response, *keys: str
+    ) -> Dict[str, Any]:
+        """
+        Decode the json body of a response and check its fields.
+
+        :param response: Response from a request.
+        :param keys: Fields that the body must contain.
+        :return: Decoded json.
+        """
+        try:
+            body = cls._get_json(response)
+        except json.JSONDecodeError as e:
+            raise p1_exc.ParseResponseException(
+                "Can't decode server response as json"
+            ) from e
+        if not isinstance(body, dict):
+            raise p1_exc.ParseResponseException(
+                f"Server response is not a json object: {type(body)}"
+            )
+        missing_keys = [key for key in keys if key not in body]
+        if missing_keys:
+            raise p1_exc.ParseResponseException(
+                f"Server response misses the fields: {missing_keys}"
+            )
+        return body
+
     def _get_versions(self):
         """
         Get package versions.
@@ -139,18 +263,22 @@ class AbstractClient:
         :param kwargs: All parameters should be implemented.
         :return: Params dict.
         """
-        for param, value in [(k, v) for k, v in kwargs.items()
-                             if v is not None]:
+        for param, value in kwargs.items():
+            if value is None:
+                continue
             if param.endswith("datetime"):
-                self.validate_date(kwargs[param])
+                self.validate_date(value)
             params[param] = value
-
         return params
 
     def _get_session(self) -> requests.Session:
         """
         Initialize and return a session allows make retry when some errors
         will raised.
+
+        The session keeps up to `pool_size` connections alive, so that
+        consecutive and concurrent requests reuse them instead of opening a
+        new connection each time.
         """
         session = requests.Session()
         retry = rq_retry.Retry(
@@ -159,18 +287,28 @@ class AbstractClient:
             connect=self.retries_number,
             backoff_factor=self.backoff_factor,
             status_forcelist=self.status_forcelist,
+            # Return the last response when the retries are exhausted, so that
+            # `_make_request()` raises the client's exceptions instead of
+            # `requests.exceptions.RetryError`.
+            raise_on_status=False,
+        )
+        adapter = rq_adapt.HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
         )
-        adapter = rq_adapt.HTTPAdapter(max_retries=retry)
+        session.mount("http://", adapter)
         session.mount("https://", adapter)
+        # The user agent doesn't change, so send it with every request.
+        session.headers["User-Agent"] = self._get_versions()
         return session
 
     def _make_request(self, *args: Any, **kwargs: Any) -> requests.Response:
         """
         Single entry point for any request to the REST API.
         """
-        if kwargs.get("headers") is None:
-            kwargs["headers"] = dict()
-        kwargs["headers"]["User-Agent"] = self._get_versions()
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
         response = self.session.request(*args, **kwargs)
         # Throw exception, if token is not valid.
         if response.status_code == 401:
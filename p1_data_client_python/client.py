@@ -38,6 +38,13 @@ class Client(p1_abs.AbstractClient):
         "FREQUENCIES": _URL + "/frequencies/",
     }
 
+    _API_ROUTES = {
+        "AUTH": "/auth-token/",
+        "SEARCH": "/data-api/v1/search/",
+        "SEARCH_SCROLL": "/data-api/v1/search-scroll/",
+        "PAYLOAD": "/data-api/v1/payload/",
+    }
+
     @property
     def list_of_metadata(self) -> List[str]:
         """Retrieve list of metadata keys from METADATA_ROUTES."""
@@ -66,12 +73,12 @@ class Client(p1_abs.AbstractClient):
         """Get next chunk (page) of payloads by given scroll_id."""
         response = self._make_request(
             "GET",
-            self.base_url + self._api_routes["SEARCH_SCROLL"],
+            self._urls["SEARCH_SCROLL"],
             headers=self.headers,
             params={"scroll_id": self._scroll_id},
         )
         try:
-            next_page = response.json()
+            next_page = self._get_json(response)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(
                 msg=f"Can't decode response: "
@@ -96,7 +103,7 @@ class Client(p1_abs.AbstractClient):
         self._last_search_parameters = search_payload
         response = self._make_request(
             "POST",
-            self.base_url + self._api_routes["SEARCH"],
+            self._urls["SEARCH"],
             headers=self.headers,
             data=json.dumps(self._last_search_parameters),
         )
@@ -116,7 +123,7 @@ class Client(p1_abs.AbstractClient):
         """
         response = self._make_request(
             "GET",
-            self.base_url + self._api_routes["PAYLOAD"],
+            self._urls["PAYLOAD"],
             headers=self.headers,
             params={"payload_id": payload_id},
         )
@@ -164,33 +171,28 @@ class Client(p1_abs.AbstractClient):
 
     @property
     def _api_routes(self) -> Dict[str, str]:
-        return {
-            "AUTH": "/auth-token/",
-            "SEARCH": "/data-api/v1/search/",
-            "SEARCH_SCROLL": "/data-api/v1/search-scroll/",
-            "PAYLOAD": "/data-api/v1/payload/",
-        }
+        return self._API_ROUTES
 
     def _parse_search(self, response: requests.Response) -> pd.DataFrame:
         """Parse search response and return pandas Dataframe."""
-        payloads = response.json()
+        payloads = self._get_json(response)
         self._scroll_id = payloads["scroll_id"]
         self._last_total_count = payloads["total_count"]
         return pd.DataFrame(payloads["rows"])
 
-    @staticmethod
-    def _parse_payload(response: requests.Response) -> pd.DataFrame:
+    @classmethod
+    def _parse_payload(cls, response: requests.Response) -> pd.DataFrame:
         """Parse payload response and return pandas Dataframe."""
-        payload_response = response.json()
+        payload_response = cls._get_json(response)
         payload = pd.DataFrame(payload_response["payload_data"])
         payload["period"] = hdatet.to_datetime(payload["original_period"])
         return payload
 
-    @staticmethod
+    @classmethod
     def _parse_metadata_type(
-        metadata_type: str, response: requests.Response
+        cls, metadata_type: str, response: requests.Response
     ) -> pd.DataFrame:
         """Parse metadata_type response and return pandas Dataframe."""
-        metadata_response = response.json()
+        metadata_response = cls._get_json(response)
         metadata_list = [row["name"] for row in metadata_response["data"]]
         return pd.DataFrame(metadata_list, columns=[metadata_type])
@@ -4,6 +4,7 @@ Store constants for P1 Edgar Data REST API wrapper.
 Import as: import p1_data_client_python.edgar.config as peconf
 """
 
+import itertools
 import os
 from typing import Any, Dict, List, Union
 
@@ -16,6 +17,8 @@ ITEM_BLOCK_SIZE = 500
 # Used to point what type of the field have to be used
 # when start_date/end_date given.
 DATE_MODE = ["publication_date", "knowledge_date"]
+# List of possible options for the dtype_backend parameter of form8.
+DTYPE_BACKENDS = ["numpy_nullable", "pyarrow"]
 # Field types for form8 cast.
 FORM8_FIELD_TYPES = {
     "gvk": "int64",
@@ -36,9 +39,15 @@ FORM_NAMES_TYPES = {
     "form10": ["10-K", "10-K/A", "10-Q", "10-Q/A"],
     "form13": ["13F-HR", "13F-HR/A"],
 }
+# All the form types in the Edgar universe.
+FORM_TYPES = tuple(itertools.chain.from_iterable(FORM_NAMES_TYPES.values()))
 # Edgar's data API constant passes to Python client class.
 P1_EDGAR_DATA_API_VERSION = os.environ.get("P1_EDGAR_DATA_API_VERSION",
                                            CURRENT_EDGAR_DATA_API_VERSION)
+# Default url of the Edgar's data API server.
+DEFAULT_BASE_URL = (
+    f"https://data.particle.one/edgar/v{P1_EDGAR_DATA_API_VERSION}/"
+)
 # Number of payload in each request to the server.
 # This depends on the size of each form.
 # E.g., `headers` are typically small and fast to retrieved by the backend,
@@ -48,6 +57,10 @@ PAYLOAD_BLOCK_SIZE = {
     "form4_13": 500,
     "form8": 1000,
 }
+# Max number of pages of a response that are requested at the same time.
+MAX_CONCURRENT_REQUESTS = 8
+# Max number of mapping responses (e.g., CIK <-> GVK) cached by each client.
+MAPPING_CACHE_SIZE = 4096
 P1_CIK = int
 P1_GVK = int
 SERVER_RESPONSE_TYPE = Dict[str, Any]
@@ -11,15 +11,22 @@ Import as:
 import p1_data_client_python.edgar.edgar_client as peedga
 """
 
+import collections
+import concurrent.futures as cfutur
+import functools
 import itertools
 import json
 import logging
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-import halo  # type: ignore
 import pandas as pd
 import tqdm.auto as tauto
 
+try:
+    import pyarrow as pa  # type: ignore
+except ImportError:
+    pa = None
+
 import p1_data_client_python.abstract_client as pabstr
 import p1_data_client_python.edgar.config as peconf
 import p1_data_client_python.edgar.utils as peutil
@@ -29,28 +36,70 @@ import p1_data_client_python.helpers.dbg as phdbg  # type: ignore
 _LOG = logging.getLogger(__name__)
 phdbg.init_logger(logging.INFO, force_print_format=True)
 
+# The dtype backends of `get_form8_payload()` need pandas >= 2.0.
+_PANDAS_MAJOR_VERSION = int(pd.__version__.split(".")[0])
+
 
 class EdgarClient(pabstr.AbstractClient):
     """
     Class for p1 Edgar data REST API operating.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any):
+    _API_ROUTES = {
+        "PAYLOAD": "/data",
+        "CIK": "/metadata/cik",
+        "GVK": "/metadata/gvk",
+        "ITEM": "/metadata/item",
+        "HEADERS": "/data/headers",
+    }
+
+    def __init__(
+        self,
+        *args: Any,
+        item_block_size: int = peconf.ITEM_BLOCK_SIZE,
+        page_size: Optional[int] = None,
+        max_concurrent_requests: int = peconf.MAX_CONCURRENT_REQUESTS,
+        **kwargs: Any,
+    ):
         """
         Edgar client init.
+
+        :param item_block_size: Number of items (CIK, CUSIP) sent to the
+            server in one request.
+        :param page_size: Number of records per page of the payload requests,
+            sent as the `limit` parameter. Larger pages need fewer round
+            trips. None means the server default.
+        :param max_concurrent_requests: Max number of pages of a response
+            requested at the same time. 1 requests the pages one by one.
+            Unless `pool_size` is given, the connection pool has the same size.
         """
+        phdbg.dassert_lte(1, max_concurrent_requests)
+        # Keep one pooled connection for each concurrent page request, so
+        # that the pages don't open and drop extra connections.
+        kwargs.setdefault("pool_size", max_concurrent_requests)
         super().__init__(*args, **kwargs)
-        self.cik_gvk_mapping = None
+        self.item_block_size = item_block_size
+        self.page_size = page_size
+        self.max_concurrent_requests = max_concurrent_requests
+        # Build the urls of the payload endpoints once.
+        payload_url = self._urls["PAYLOAD"]
+        self._payload_urls = {
+            form_name: f"{payload_url}/{form_name}"
+            for form_name in peconf.FORM_NAMES_TYPES
+        }
+        # Cache the responses per client, so that the cache is released
+        # together with the client and its session.
+        self._get_cik = functools.lru_cache(
+            maxsize=peconf.MAPPING_CACHE_SIZE
+        )(self._request_cik)
+        self.cik_gvk_mapping: Dict[
+            peconf.P1_CIK, Optional[peconf.P1_GVK]
+        ] = {}
         self.is_jupyter = phdbg.is_running_in_ipynb()
         self.pb_position = 0
-        if self.is_jupyter:
-            self.spinner = halo.HaloNotebook(
-                text="Waiting response size...", spinner="dots"
-            )
-        else:
-            self.spinner = halo.Halo(
-                text="Waiting response size...", spinner="dots"
-            )
+        self.spinner = peutil.get_spinner(
+            "Waiting response size...", self.is_jupyter
+        )
 
     def get_form_headers(
         self,
@@ -88,7 +137,7 @@ class EdgarClient(pabstr.AbstractClient):
             date_mode=date_mode,
             cik=cik,
         )
-        url = f'{self.base_url}{self._api_routes["HEADERS"]}'
+        url = self._urls["HEADERS"]
         result: Union[List[peconf.SERVER_RESPONSE_TYPE], pd.DataFrame] = []
         for data in self._payload_form_cik_cusip_generator(
             method="GET", url=url, headers=self.headers, params=params
@@ -126,6 +175,41 @@ class EdgarClient(pabstr.AbstractClient):
         )
         return result
 
+    def iter_form4_payload(
+        self,
+        cik: Optional[peconf.CIK_TYPE] = None,
+        start_datetime: Optional[str] = None,
+        end_datetime: Optional[str] = None,
+        date_mode: Optional[str] = None,
+    ) -> Iterator[peconf.SERVER_RESPONSE_TYPE]:
+        """
+        Iterate over the pages of payload data for a form 4.
+
+        Unlike `get_form4_payload()`, the pages are not accumulated, so large
+        results can be processed page by page without holding all of them in
+        memory. The pages are requested while iterating, at most
+        `max_concurrent_requests` of them ahead of the consumed ones.
+
+        :param cik: Central Index Key as integer. Could be list of P1_CIK or
+            just one identifier.
+        :param start_datetime: Get data where filing date is >= start_date. Date
+            format is "YYYY-MM-DDTHH-MI-SS". None means the entire available date range.
+        :param end_datetime: Get data where filing date is <= end_date. Date format
+            is "YYYY-MM-DDTHH-MI-SS". None means the entire available date range.
+        :param date_mode: Define whether dates are
+            interpreted as publication dates or knowledge dates
+        :return: Iterator over dicts with the rows of each data table.
+        """
+        peutil.check_date_mode(start_datetime, end_datetime, date_mode)
+        cik = peutil.check_sorted_unique_param("cik", cik)
+        return self._iter_form4_13_pages(
+            "form4",
+            cik=cik,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            date_mode=date_mode,
+        )
+
     def get_form8_payload(
         self,
         cik: Optional[peconf.CIK_TYPE] = None,
@@ -133,6 +217,8 @@ class EdgarClient(pabstr.AbstractClient):
         end_datetime: Optional[str] = None,
         date_mode: Optional[str] = None,
         item: Optional[str] = None,
+        sort: bool = True,
+        dtype_backend: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Get payload data for a form 8 and a company.
@@ -146,9 +232,26 @@ class EdgarClient(pabstr.AbstractClient):
         :param date_mode: Define whether dates are
             interpreted as publication dates or knowledge dates
         :param item: Item to retrieve. None means all items.
+        :param sort: Sort the result by filing date, cik and item name. Pass
+            False to skip sorting large results in the server order.
+        :param dtype_backend: Backend of the column dtypes: "numpy_nullable"
+            or "pyarrow" to get Arrow-backed columns. Requires pandas >= 2.0,
+            and pyarrow for "pyarrow". None keeps the default NumPy dtypes.
         :return: Pandas dataframe with payload data.
         """
         peutil.check_date_mode(start_datetime, end_datetime, date_mode)
+        if dtype_backend is not None:
+            phdbg.dassert_in(dtype_backend, peconf.DTYPE_BACKENDS)
+            phdbg.dassert_lte(
+                2,
+                _PANDAS_MAJOR_VERSION,
+                msg="The dtype_backend parameter requires pandas >= 2.0.",
+            )
+        if dtype_backend == "pyarrow":
+            phdbg.dassert(
+                pa is not None,
+                msg="The pyarrow dtype backend requires pyarrow installed.",
+            )
         cik = peutil.check_sorted_unique_param("cik", cik)
         form_name = "form8"
         params: Dict[str, Any] = {}
@@ -160,24 +263,52 @@ class EdgarClient(pabstr.AbstractClient):
             cik=cik,
             date_mode=date_mode,
         )
-        url = f'{self.base_url}{self._api_routes["PAYLOAD"]}' f"/{form_name}"
-        payload_dataframe = pd.DataFrame()
-        for df in self._payload_form_cik_cusip_generator(
+        url = self._payload_urls[form_name]
+        # Collect the records of all the pages and build the dataframe once,
+        # instead of growing it page by page.
+        records: List[peconf.SERVER_RESPONSE_TYPE] = []
+        for data in self._payload_form_cik_cusip_generator(
             method="GET", url=url, headers=self.headers, params=params
         ):
-            payload_dataframe = payload_dataframe.append(df, ignore_index=True)
+            records += data
+        if dtype_backend == "pyarrow" and records:
+            # Build the Arrow columns straight from the records, instead of
+            # building NumPy columns and converting them.
+            try:
+                table = pa.Table.from_pylist(records)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                # E.g., a column mixing strings and numbers.
+                raise pexcep.ParseResponseException(
+                    "Can't transform server response to Arrow columns"
+                ) from e
+            payload_dataframe = table.to_pandas(types_mapper=pd.ArrowDtype)
+            dtype_backend = None
+        else:
+            payload_dataframe = pd.DataFrame(records)
+        # Release the records before sorting, so that they don't stay in
+        # memory together with the dataframe and its sorted copy.
+        del records
         if (
-            not payload_dataframe.empty
+            sort
+            and not payload_dataframe.empty
             and {
                 "filing_date",
                 "cik",
                 "item_name",
             }.issubset(payload_dataframe.columns)
         ):
+            # Renumber the rows while sorting, instead of copying the sorted
+            # frame again to reset its index.
             payload_dataframe = payload_dataframe.sort_values(
-                ["filing_date", "cik", "item_name"]
+                ["filing_date", "cik", "item_name"],
+                ignore_index=True,
+                kind="mergesort",
+            )
+        if dtype_backend is not None:
+            payload_dataframe = payload_dataframe.convert_dtypes(
+                dtype_backend=dtype_backend
             )
-        return payload_dataframe.reset_index(drop=True)
+        return payload_dataframe
 
     def get_form10_payload(
         self,
@@ -207,24 +338,33 @@ class EdgarClient(pabstr.AbstractClient):
             params, start_datetime=start_datetime, end_datetime=end_datetime,
             date_mode=date_mode
         )
-        url = f'{self.base_url}{self._api_routes["PAYLOAD"]}/{form_name}'
+        url = self._payload_urls[form_name]
         cik_list: List[Union[int, None]] = [None]
         compound_data = []
         if cik is not None:
             cik_list = [cik] if isinstance(cik, int) else cik
         self.spinner.start()
         with peutil.spinner_exception_handling(self.spinner):
+            first_response = True
             for current_cik in tauto.tqdm(cik_list, desc="Processing CIK: "):
-                self._set_optional_params(params, cik=current_cik)
+                # Build the params of each request instead of updating the
+                # shared ones.
+                request_params = params
+                if current_cik is not None:
+                    request_params = {**params, "cik": current_cik}
                 response = self._make_request(
-                    "GET", url, headers=self.headers, params=params
+                    "GET", url, headers=self.headers, params=request_params
                 )
-                self.spinner.stop()
-                data = response.json()["data"]
+                # The spinner is only shown while waiting for the first
+                # response, so stop it once.
+                if first_response:
+                    self.spinner.stop()
+                    first_response = False
+                data = self._get_response_body(response, "data")["data"]
                 _LOG.info("%s: %s forms loaded",
                           current_cik or "Total",
                           len(data))
-                compound_data += response.json()["data"]
+                compound_data += data
         return compound_data
 
     def get_form10_uuid_payload(
@@ -239,14 +379,14 @@ class EdgarClient(pabstr.AbstractClient):
         """
         form_name = "form10"
         params: Dict[str, Any] = {"uuid": uuid}
-        url = f'{self.base_url}{self._api_routes["PAYLOAD"]}/{form_name}/uuid'
+        url = f"{self._payload_urls[form_name]}/uuid"
         self.spinner.start()
         with peutil.spinner_exception_handling(self.spinner):
             response = self._make_request(
                 "GET", url, headers=self.headers, params=params
             )
             self.spinner.stop()
-            data = response.json()["data"]
+            data = self._get_response_body(response, "data")["data"]
             _LOG.info("Payload for '%s' uuid loaded", uuid)
         return data
 
@@ -275,6 +415,45 @@ class EdgarClient(pabstr.AbstractClient):
         )
         return result
 
+    def iter_form13_payload(
+        self,
+        cik: Optional[peconf.CIK_TYPE] = None,
+        cusip: Optional[peconf.CUSIP_TYPE] = None,
+        start_datetime: Optional[str] = None,
+        end_datetime: Optional[str] = None,
+        date_mode: Optional[str] = None,
+    ) -> Iterator[peconf.SERVER_RESPONSE_TYPE]:
+        """
+        Iterate over the pages of payload data for a form 13.
+
+        Unlike `get_form13_payload()`, the pages are not accumulated, and at
+        most `max_concurrent_requests` of them are requested ahead of the
+        consumed ones.
+
+        :param cik: Central Index Key as integer. Could be list of P1_CIK or
+            just one identifier.
+        :param cusip: Committee on Uniform Securities Identification Procedures
+            number. Could be list or just one identifier.
+        :param start_datetime: Get data where filing date is >= start_date. Date
+            format is "YYYY-MM-DDTHH-MI-SS". None means the entire available date range.
+        :param end_datetime: Get data where filing date is <= end_date. Date format
+            is "YYYY-MM-DDTHH-MI-SS". None means the entire available date range.
+        :param date_mode: Define whether dates are
+            interpreted as publication dates or knowledge dates
+        :return: Iterator over dicts with the rows of each data table.
+        """
+        peutil.check_date_mode(start_datetime, end_datetime, date_mode)
+        cik = peutil.check_sorted_unique_param("cik", cik)
+        cusip = peutil.check_sorted_unique_param("cusip", cusip)
+        return self._iter_form4_13_pages(
+            "form13",
+            cik=cik,
+            cusip=cusip,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            date_mode=date_mode,
+        )
+
     def get_cik(
         self,
         gvk: Optional[peconf.P1_GVK] = None,
@@ -295,6 +474,20 @@ class EdgarClient(pabstr.AbstractClient):
         :param company: Company name.
         :return: Pandas dataframe with cik information.
         """
+        # Copy the cached dataframe, so that callers can't modify the cache.
+        return self._get_cik(gvk, gvk_date, ticker, cusip, company).copy()
+
+    def _request_cik(
+        self,
+        gvk: Optional[peconf.P1_GVK],
+        gvk_date: Optional[str],
+        ticker: Optional[str],
+        cusip: Optional[str],
+        company: Optional[str],
+    ) -> pd.DataFrame:
+        """
+        Request cik by the given parameters, without caching.
+        """
         params: Dict[str, Any] = {}
         params = self._set_optional_params(
             params,
@@ -304,12 +497,54 @@ class EdgarClient(pabstr.AbstractClient):
             cusip=cusip,
             company=company,
         )
-        url = f'{self.base_url}{self._api_routes["CIK"]}'
+        url = self._urls["CIK"]
         response = self._make_request(
             "GET", url, headers=self.headers, params=params
         )
         return self._get_dataframe_from_response(response)
 
+    def prefetch_gvk_cik_mapping(self, ciks: List[peconf.P1_CIK]) -> None:
+        """
+        Load the CIK -> GVK mapping for a batch of CIKs and cache it.
+
+        CIKs are requested in blocks of `item_block_size`, so a batch costs
+        one request per block instead of one request per CIK. CIKs that are
+        already cached are not requested again.
+
+        :param ciks: List of Central Index Keys.
+        """
+        missing_ciks = sorted(
+            {cik for cik in ciks if cik not in self.cik_gvk_mapping}
+        )
+        url = self._urls["GVK"]
+        for chunk in peutil.chop_list(missing_ciks, self.item_block_size):
+            response = self._make_request(
+                "GET", url, headers=self.headers, params={"cik": chunk}
+            )
+            mapping = self._get_dataframe_from_response(response)
+            if not mapping.empty:
+                # Keep the most recent GVK when a CIK has several of them.
+                if "effdate" in mapping.columns:
+                    mapping = mapping.sort_values("effdate")
+                for cik, gvk in zip(mapping["cik"], mapping["gvk"]):
+                    self.cik_gvk_mapping[int(cik)] = int(gvk)
+            # Remember CIKs without GVK to avoid requesting them again.
+            for cik in chunk:
+                self.cik_gvk_mapping.setdefault(cik, None)
+
+    def get_gvk_cached(self, cik: peconf.P1_CIK) -> Optional[peconf.P1_GVK]:
+        """
+        Get GVK by the cik using the cached mapping.
+
+        The server is requested only when the CIK is not cached yet.
+
+        :param cik: Central Index Key as integer.
+        :return: GVK or None if there is no GVK for the CIK.
+        """
+        if cik not in self.cik_gvk_mapping:
+            self.prefetch_gvk_cik_mapping([cik])
+        return self.cik_gvk_mapping.get(cik)
+
     @property
     def form_types(self) -> List[str]:
         """
@@ -317,23 +552,16 @@ class EdgarClient(pabstr.AbstractClient):
 
         :return: List for form types.
         """
-        form_types_list = [
-            form_types for _, form_types in peconf.FORM_NAMES_TYPES.items()
-        ]
-        return list(itertools.chain.from_iterable(form_types_list))
+        # Return a copy, so that the callers can't change the shared types.
+        return list(peconf.FORM_TYPES)
 
     @property
     def _default_base_url(self) -> str:
-        return f"https://data.particle.one/edgar/v{peconf.P1_EDGAR_DATA_API_VERSION}/"
+        return peconf.DEFAULT_BASE_URL
 
     @property
     def _api_routes(self) -> Dict[str, str]:
-        return {
-            "PAYLOAD": "/data",
-            "CIK": "/metadata/cik",
-            "ITEM": "/metadata/item",
-            "HEADERS": "/data/headers",
-        }
+        return self._API_ROUTES
 
     @classmethod
     def _process_form_4_13_10_output(
@@ -389,6 +617,49 @@ class EdgarClient(pabstr.AbstractClient):
         :param output_type: Output format: 'dict' or 'dataframes'.
         :return: Dict with a data tables.
         """
+        phdbg.dassert(
+            output_type in ("dict", "dataframes"),
+            msg="The output_type parameter should be a dict " "or dataframes.",
+        )
+        pages = self._iter_form4_13_pages(
+            form_type,
+            cik=cik,
+            cusip=cusip,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            date_mode=date_mode,
+        )
+        # Store the pages of each table and flatten them once at the end.
+        table_pages: Dict[str, List[list]] = collections.defaultdict(list)
+        for data in pages:
+            for key, rows in data.items():
+                table_pages[key].append(rows)
+        compound_data: peconf.SERVER_RESPONSE_TYPE = {
+            key: list(itertools.chain.from_iterable(pages))
+            for key, pages in table_pages.items()
+        }
+        return self._process_form_4_13_10_output(
+            compound_data, output_type=output_type
+        )
+
+    def _iter_form4_13_pages(
+        self,
+        form_type: str,
+        cik: Optional[peconf.CIK_TYPE] = None,
+        cusip: Optional[peconf.CUSIP_TYPE] = None,
+        start_datetime: Optional[str] = None,
+        end_datetime: Optional[str] = None,
+        date_mode: Optional[str] = None,
+    ) -> Iterator[peconf.SERVER_RESPONSE_TYPE]:
+        """
+        Iterate over the pages of payload data for forms 4 or 13.
+
+        The arguments are checked right away, the pages are requested while
+        iterating.
+
+        :param form_type: Form type. Allowed range of values: form4, form13.
+        :return: Iterator over dicts with the rows of each data table.
+        """
         phdbg.dassert(
             not (cik is not None and cusip is not None),
             msg="You cannot pass CIK and CUSIP parameters " "at the same time.",
@@ -397,10 +668,6 @@ class EdgarClient(pabstr.AbstractClient):
             form_type in ("form13", "form4"),
             msg="The form_type parameter should be form13 or form4.",
         )
-        phdbg.dassert(
-            output_type in ("dict", "dataframes"),
-            msg="The output_type parameter should be a dict " "or dataframes.",
-        )
         params: Dict[str, Any] = {}
         params = self._set_optional_params(
             params,
@@ -410,81 +677,171 @@ class EdgarClient(pabstr.AbstractClient):
             cusip=cusip,
             date_mode=date_mode,
         )
-        url = f'{self.base_url}{self._api_routes["PAYLOAD"]}/{form_type}'
-        compound_data: peconf.SERVER_RESPONSE_TYPE = {}
-        for data in self._payload_form_cik_cusip_generator(
+        url = self._payload_urls[form_type]
+        return self._payload_form_cik_cusip_generator(
             method="GET", url=url, headers=self.headers, params=params
-        ):
-            for key in data:
-                if key in compound_data:
-                    compound_data[key] += data[key]
-                else:
-                    compound_data[key] = data[key]
-        return self._process_form_4_13_10_output(
-            compound_data, output_type=output_type
         )
 
     def _payload_page_generator(self, **kwargs) -> Iterator[dict]:
         """
         Iterate over the pages with links.
+
+        The first page gives the number of records and the page size, so the
+        remaining pages are requested concurrently and yielded in order.
         """
-        has_next_link = True
         self.pb_position += 1
-        progress_bar = tauto.tqdm(
-            desc="Pages: ", position=self.pb_position, leave=False
-        )
-        while has_next_link:
-            response = self._make_request(**kwargs)
-            # Parse links.
-            links = peutil.Links(response.json()["links"])
-            has_next_link = links.has_next_link
-            if progress_bar.total is None:
-                progress_bar.reset(total=response.json()["count"])
-            # Return the data.
-            yield response.json()["data"]
-            # Update the progress bar.
-            if not has_next_link:
-                progress_bar.n = progress_bar.total
-            else:
-                progress_bar.n = links.current_offset
-            progress_bar.display()
-            # Replace an url for a next page.
+        response = self._make_request(**kwargs)
+        body = self._get_response_body(response, "links", "data")
+        links = peutil.Links(body["links"])
+        # Without the number of records the pages can't be computed upfront,
+        # so they are found by following the links.
+        count = body.get("count")
+        data = body["data"]
+        # Empty pages (e.g. a block of CIKs without records) are not yielded,
+        # so the callers don't accumulate them.
+        if data:
+            yield data
+        if links.has_next_link:
+            # The page size comes from the link offsets: `data` can be a dict
+            # of tables (e.g., Form 4 and 13), so its length is not the number
+            # of records in the page.
+            page_urls = None
+            if count is not None:
+                page_urls = peutil.get_page_urls(links, count)
+            # Without the urls the number of pages is unknown.
+            num_pages = None
+            if page_urls is not None:
+                num_pages = 1 + len(page_urls)
+            # Create the progress bar only for multi-page responses, a
+            # single page doesn't need it.
+            progress_bar = tauto.tqdm(
+                total=num_pages,
+                desc="Pages: ",
+                position=self.pb_position,
+                leave=False,
+                mininterval=0.5,
+            )
+            progress_bar.update()
+            # Next pages are requested by their urls only.
             kwargs.pop("params", None)
-            kwargs["url"] = links.next_url
-        progress_bar.close()
+            kwargs.pop("url", None)
+            if page_urls is None:
+                # The links can't be turned into offsets: follow them.
+                pages = self._follow_page_links(links, len(data), **kwargs)
+            else:
+                pages = self._get_pages(page_urls, **kwargs)
+            for data in pages:
+                if data:
+                    yield data
+                progress_bar.update()
+            progress_bar.close()
         self.pb_position -= 1
 
+    def _get_pages(self, page_urls: List[str], **kwargs: Any) -> Iterator[list]:
+        """
+        Request the pages concurrently and iterate over their data in order.
+
+        At most `max_concurrent_requests` pages are requested or waiting to
+        be consumed at any time, so that the pages don't pile up in memory
+        when the caller is slower than the server.
+
+        :param page_urls: Urls of the pages.
+        :param kwargs: Other arguments of the request.
+        """
+
+        def _get_page(url: str) -> list:
+            response = self._make_request(url=url, **kwargs)
+            return self._get_response_body(response, "data")["data"]
+
+        page_urls_iter = iter(page_urls)
+        with cfutur.ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests
+        ) as executor:
+            futures = collections.deque(
+                executor.submit(_get_page, url)
+                for url in itertools.islice(
+                    page_urls_iter, self.max_concurrent_requests
+                )
+            )
+            while futures:
+                data = futures.popleft().result()
+                # Request the next page in place of the consumed one.
+                url = next(page_urls_iter, None)
+                if url is not None:
+                    futures.append(executor.submit(_get_page, url))
+                yield data
+
+    def _follow_page_links(
+        self, links: peutil.Links, page_size: int, **kwargs: Any
+    ) -> Iterator[list]:
+        """
+        Request the pages one by one following the next links.
+
+        The next page is requested as soon as its link is known, so that it
+        downloads while the caller processes the current page. A page of
+        records shorter than the first one is the last page, so the next
+        link is not requested after it.
+
+        :param links: Links of the first page.
+        :param page_size: Number of records in the first page.
+        :param kwargs: Other arguments of the request.
+        """
+
+        def _get_page(url: str) -> Tuple[peutil.Links, Any]:
+            response = self._make_request(url=url, **kwargs)
+            body = self._get_response_body(response, "links", "data")
+            return peutil.Links(body["links"]), body["data"]
+
+        if not links.has_next_link:
+            return
+        with cfutur.ThreadPoolExecutor(max_workers=1) as executor:
+            future: Optional[cfutur.Future] = executor.submit(
+                _get_page, links.next_url
+            )
+            while future is not None:
+                links, data = future.result()
+                future = None
+                is_last_page = isinstance(data, list) and len(data) < page_size
+                if links.has_next_link and not is_last_page:
+                    future = executor.submit(_get_page, links.next_url)
+                yield data
+
     def _payload_form_cik_cusip_generator(self, **kwargs):
         """
         Iterate through the list of cik.
         """
         self.pb_position = 1
-        iter_name = ""
+        iter_key = None
         iter_list = [None]
-        params = kwargs["params"]
+        # Work on a copy, so that the caller's params are not modified.
+        params = dict(kwargs.pop("params"))
+        if self.page_size is not None:
+            params["limit"] = self.page_size
         # Build a list to iterate over. Can be CIK or CUSIP (or neither).
         if "cik" in params:
-            iter_name = "CIK"
-            iter_list = [params["cik"]]
-            if isinstance(params["cik"], list):
-                iter_list = params["cik"]
+            iter_key = "cik"
         elif "cusip" in params:
-            iter_name = "CUSIP"
-            iter_list = [params["cusip"]]
-            if isinstance(params["cusip"], list):
-                iter_list = params["cusip"]
-        chunks = list(peutil.chop_list(iter_list, peconf.ITEM_BLOCK_SIZE))
+            iter_key = "cusip"
+        if iter_key is not None:
+            iter_list = [params[iter_key]]
+            if isinstance(params[iter_key], list):
+                iter_list = params[iter_key]
+        iter_name = (iter_key or "").upper()
+        chunks = list(peutil.chop_list(iter_list, self.item_block_size))
         with peutil.spinner_exception_handling(self.spinner):
             for item in tauto.tqdm(
                 chunks,
                 desc=f"Processing {iter_name}: ",
                 position=self.pb_position,
             ):
-                if iter_name == "CIK":
-                    self._set_optional_params(params, cik=item)
-                elif iter_name == "CUSIP":
-                    self._set_optional_params(params, cusip=item)
-                yield from self._payload_page_generator(**kwargs)
+                # Each block gets its own params, so the blocks don't share
+                # state. The items are already validated, so set them directly.
+                block_params = dict(params)
+                if iter_key is not None:
+                    block_params[iter_key] = item
+                yield from self._payload_page_generator(
+                    params=block_params, **kwargs
+                )
 
     @classmethod
     def _cast_field_types(
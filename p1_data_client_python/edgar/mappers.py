@@ -3,6 +3,7 @@ Helper classes for the Edgar mapping.
 
 Import as: import p1_data_client_python.edgar.mappers as pemapp
 """
+import functools
 import pandas as pd
 from typing import Any, Dict, Optional
 
@@ -15,6 +16,8 @@ class ItemMapper(pabstr.AbstractClient):
     Handler for an item mapping.
     """
 
+    _API_ROUTES = {"MAPPING": "/metadata/mapping", "ITEM": "/metadata/item"}
+
     def get_mapping(self) -> pd.DataFrame:
         """
         Get all mapping for items.
@@ -22,7 +25,7 @@ class ItemMapper(pabstr.AbstractClient):
         :return: Item mapping as dataframe.
         """
         params = {"mapping_type": "items"}
-        url = f'{self.base_url}{self._api_routes["MAPPING"]}'
+        url = self._urls["MAPPING"]
         response = self._make_request(
             "GET", url, headers=self.headers, params=params
         )
@@ -37,7 +40,7 @@ class ItemMapper(pabstr.AbstractClient):
         """
         params: Dict[str, Any] = {}
         params = self._set_optional_params(params, keywords=keywords)
-        url = f'{self.base_url}{self._api_routes["ITEM"]}'
+        url = self._urls["ITEM"]
         response = self._make_request(
             "GET", url, headers=self.headers, params=params
         )
@@ -45,12 +48,11 @@ class ItemMapper(pabstr.AbstractClient):
 
     @property
     def _api_routes(self) -> Dict[str, str]:
-        return {"MAPPING": "/metadata/mapping", "ITEM": "/metadata/item"}
+        return self._API_ROUTES
 
     @property
     def _default_base_url(self) -> str:
-        return f"https://data.particle.one/" \
-               f"edgar/v{peconf.P1_EDGAR_DATA_API_VERSION}/"
+        return peconf.DEFAULT_BASE_URL
 
 
 class GvkCikMapper(pabstr.AbstractClient):
@@ -58,6 +60,19 @@ class GvkCikMapper(pabstr.AbstractClient):
     Handler for GVK <-> Cik transformation.
     """
 
+    _API_ROUTES = {
+        "GVK": "/metadata/gvk",
+        "CIK": "/metadata/cik",
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Cache the responses per mapper, so that the cache is released
+        # together with the mapper and its session.
+        cache = functools.lru_cache(maxsize=peconf.MAPPING_CACHE_SIZE)
+        self._get_gvk_from_cik = cache(self._request_gvk_from_cik)
+        self._get_cik_from_gvk = cache(self._request_cik_from_gvk)
+
     def get_gvk_from_cik(
         self, cik: peconf.P1_CIK, as_of_date: Optional[str] = None
     ) -> pd.DataFrame:
@@ -68,12 +83,8 @@ class GvkCikMapper(pabstr.AbstractClient):
         :param as_of_date: Date of gvk. Date format is "YYYY-MM-DD".
         Not implemented for now.
         """
-        params = {"cik": cik, "as_of_date": as_of_date}
-        url = f'{self.base_url}{self._api_routes["GVK"]}'
-        response = self._make_request(
-            "GET", url, headers=self.headers, params=params
-        )
-        return self._get_dataframe_from_response(response)
+        # Copy the cached dataframe, so that callers can't modify the cache.
+        return self._get_gvk_from_cik(cik, as_of_date).copy()
 
     def get_cik_from_gvk(
         self, gvk: peconf.P1_GVK, as_of_date: Optional[str] = None
@@ -85,9 +96,31 @@ class GvkCikMapper(pabstr.AbstractClient):
         :param as_of_date: Date of gvk, if missed then
         more than one cik may be to be returned.
         """
+        # Copy the cached dataframe, so that callers can't modify the cache.
+        return self._get_cik_from_gvk(gvk, as_of_date).copy()
+
+    def _request_gvk_from_cik(
+        self, cik: peconf.P1_CIK, as_of_date: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Request GVK by the cik and date, without caching.
+        """
+        params = {"cik": cik, "as_of_date": as_of_date}
+        url = self._urls["GVK"]
+        response = self._make_request(
+            "GET", url, headers=self.headers, params=params
+        )
+        return self._get_dataframe_from_response(response)
+
+    def _request_cik_from_gvk(
+        self, gvk: peconf.P1_GVK, as_of_date: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Request Cik by GVK and date, without caching.
+        """
         params: Dict[str, Any] = {}
         params = self._set_optional_params(params, gvk=gvk, gvk_date=as_of_date)
-        url = f'{self.base_url}{self._api_routes["CIK"]}'
+        url = self._urls["CIK"]
         response = self._make_request(
             "GET", url, headers=self.headers, params=params
         )
@@ -95,12 +128,8 @@ class GvkCikMapper(pabstr.AbstractClient):
 
     @property
     def _api_routes(self) -> Dict[str, str]:
-        return {
-            "GVK": "/metadata/gvk",
-            "CIK": "/metadata/cik",
-        }
+        return self._API_ROUTES
 
     @property
     def _default_base_url(self) -> str:
-        return f"https://data.particle.one/" \
-               f"edgar/v{peconf.P1_EDGAR_DATA_API_VERSION}/"
+        return peconf.DEFAULT_BASE_URL
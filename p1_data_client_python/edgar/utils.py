@@ -3,7 +3,6 @@ Utils for the Edgar API.
 
 Import as: import p1_data_client_python.edgar.utils as peutil
 """
-import halo
 import contextlib as contex
 import logging
 import os
@@ -11,6 +10,11 @@ import pathlib
 from typing import Any, Dict, Generator, Iterator, List, Optional, Union
 import urllib.parse as uparse
 
+try:
+    import halo  # type: ignore
+except ImportError:
+    halo = None
+
 import p1_data_client_python.edgar.config as peconf
 import p1_data_client_python.helpers.dbg as phdbg  # type: ignore
 
@@ -43,10 +47,64 @@ class Links:
         self.next_url = links.get("next")
 
 
+def get_page_urls(links: Links, count: int) -> Optional[List[str]]:
+    """
+    Build the urls of all the pages following the current one.
+
+    The page size is the distance between the current and the next offsets.
+
+    :param links: Links of the current page.
+    :param count: Total number of records.
+    :return: Urls of the next pages or None if the next link has no offset.
+    """
+    next_url = uparse.urlparse(links.next_url)
+    next_params = uparse.parse_qs(next_url.query)
+    if "offset" not in next_params:
+        return None
+    next_offset = int(next_params["offset"][0])
+    page_size = next_offset - links.current_offset
+    if page_size <= 0:
+        return None
+    # Only the offset changes between pages, so encode the rest once.
+    del next_params["offset"]
+    query = uparse.urlencode(next_params, doseq=True)
+    prefix = next_url._replace(query=query).geturl()
+    separator = "&" if query else "?"
+    page_urls = [
+        f"{prefix}{separator}offset={offset}"
+        for offset in range(next_offset, count, page_size)
+    ]
+    return page_urls
+
+
+class NullSpinner:
+    """
+    Spinner doing nothing, used when `halo` is not installed.
+    """
+
+    def start(self) -> "NullSpinner":
+        return self
+
+    def stop(self) -> "NullSpinner":
+        return self
+
+
+def get_spinner(text: str, is_jupyter: bool) -> Any:
+    """
+    Build a spinner, falling back to `NullSpinner` without `halo`.
+
+    :param text: Text shown next to the spinner.
+    :param is_jupyter: Whether the spinner is shown in a notebook.
+    :return: Spinner object.
+    """
+    if halo is None:
+        return NullSpinner()
+    spinner_cls = halo.HaloNotebook if is_jupyter else halo.Halo
+    return spinner_cls(text=text, spinner="dots")
+
+
 @contex.contextmanager
-def spinner_exception_handling(
-    spinner: Union[halo.Halo, halo.HaloNotebook]
-) -> Generator:
+def spinner_exception_handling(spinner: Any) -> Generator:
     """
     Stop a spinner if exceptions happens.
 
@@ -137,13 +195,14 @@ def check_sorted_unique_param(
     """
     sorted_unique_value = value
     if isinstance(value, list):
-        sorted_unique_value = sorted(list(set(value)))
-        if len(sorted_unique_value) < len(value):
+        unique_value = set(value)
+        if len(unique_value) < len(value):
             _LOG.warning(
                 "Some values: %s in the %s parameter, are duplicated.",
                 value,
                 name,
             )
+        sorted_unique_value = sorted(unique_value)
     return sorted_unique_value
 
 
@@ -3,6 +3,7 @@
 import helpers.printing as prnt
 """
 
+import functools
 from typing import Any, Dict, Iterable, List, Optional, cast
 
 import p1_data_client_python.helpers.dbg as dbg
@@ -29,6 +30,7 @@ def clear_screen() -> None:
     print((chr(27) + "[2J"))
 
 
+@functools.lru_cache(maxsize=64)
 def line(char: Optional[str] = None, num_chars: Optional[int] = None) -> str:
     """Return a line with the desired character."""
     char = "#" if char is None else char
@@ -64,12 +66,12 @@ def frame(
     dbg.dassert_eq(len(char2), 1)
     dbg.dassert_lte(1, num_chars)
     # Build the return value.
-    ret = (
-        (line(char1, num_chars) + "\n") * thickness
-        + message
-        + "\n"
-        + (line(char2, num_chars) + "\n") * thickness
-    ).rstrip("\n")
+    lines = (
+        [line(char1, num_chars)] * thickness
+        + [message]
+        + [line(char2, num_chars)] * thickness
+    )
+    ret = "\n".join(lines).rstrip("\n")
     return ret
 
 
@@ -81,12 +83,8 @@ def space(str_: str, num_spaces: int = 2) -> str:
 
 def dedent(txt: str) -> str:
     """Remove all extra leadning / trailing spaces and empty lines."""
-    txt_out = []
-    for curr_line in txt.split("\n"):
-        curr_line = curr_line.rstrip(" ").lstrip(" ")
-        if curr_line:
-            txt_out.append(curr_line)
-    return "\n".join(txt_out)
+    lines = [curr_line.strip(" ") for curr_line in txt.split("\n")]
+    return "\n".join([curr_line for curr_line in lines if curr_line])
 
 
 def prepend(str_: str, prefix: str) -> str:
@@ -98,7 +96,7 @@ def prepend(str_: str, prefix: str) -> str:
 
 def remove_empty_lines_from_string_list(arr: List[str]) -> List[str]:
     """Remove empty lines from a list of strings."""
-    arr = [line for line in arr if line.rstrip().lstrip()]
+    arr = [line for line in arr if line and not line.isspace()]
     return arr
 
 
@@ -165,12 +163,11 @@ def perc(
     if invert:
         a = b - a
     dbg.dassert_lte(0, num_digits)
+    pct = float(a) / b * 100.0
     if only_perc:
-        fmt = "%." + str(num_digits) + "f%%"
-        ret = fmt % (float(a) / b * 100.0)
+        ret = f"{pct:.{num_digits}f}%"
     else:
-        fmt = "%s / %s = %." + str(num_digits) + "f%%"
-        ret = fmt % (a_str, b_str, float(a) / b * 100.0)
+        ret = f"{a_str} / {b_str} = {pct:.{num_digits}f}%"
     return ret
 
 
@@ -256,20 +253,17 @@ def list_to_str(
     # TODO(gp): Fix this.
     _ = to_string
     txt = ""
+    # `sorted()` already builds a new list, so don't build another one first.
     if axis == 0:
         if list_ is None:
             txt += "%s: (%s) %s" % (tag, 0, "None") + "\n"
         else:
             # dbg.dassert_in(type(l), (list, pd.Index, pd.Int64Index))
-            vals = list(map(str, list_))
-            if sort:
-                vals = sorted(vals)
+            vals = sorted(map(str, list_)) if sort else map(str, list_)
             txt += "%s: (%s) %s" % (tag, len(list_), " ".join(vals)) + "\n"
     elif axis == 1:
         txt += "%s (%s):" % (tag, len(list_)) + "\n"
-        vals = list(map(str, list_))
-        if sort:
-            vals = sorted(vals)
+        vals = sorted(map(str, list_)) if sort else map(str, list_)
         txt += "\n".join(vals) + "\n"
     else:
         raise ValueError("Invalid axis='%s'" % axis)
@@ -5,6 +5,8 @@ import helpers.unit_test as hut
 # TODO(gp): use hut instead of ut.
 """
 
+import functools
+import hashlib
 import inspect
 import logging
 import os
@@ -191,6 +193,15 @@ def convert_df_to_json_string(
     return output_str
 
 
+@functools.lru_cache(maxsize=None)
+def _read_golden(file_name: str, use_gzip: bool) -> str:
+    """Read a golden outcome once per run.
+
+    The cache is cleared whenever a golden outcome is updated.
+    """
+    return io_.from_file(file_name, use_gzip=use_gzip)
+
+
 def to_string(var: str) -> str:
     return """f"%s={%s}""" % (var, var)
 
@@ -526,6 +537,7 @@ class TestCase(unittest.TestCase):
                 # Update the test result.
                 _LOG.warning("Test outcome updated ... ")
                 io_.to_file(file_name, actual, use_gzip=use_gzip)
+                _read_golden.cache_clear()
                 # Add to git.
                 cmd = "git add %s" % file_name
                 rc = si.system(cmd, abort_on_error=False)
@@ -539,7 +551,7 @@ class TestCase(unittest.TestCase):
             if os.path.exists(file_name):
                 # Golden outcome is available: check the actual outcome against
                 # the golden outcome.
-                expected = io_.from_file(file_name, use_gzip=use_gzip)
+                expected = _read_golden(file_name, use_gzip)
                 test_name = self._get_test_name()
                 _assert_equal(
                     actual, expected, test_name, dir_name, fuzzy_match=fuzzy_match
@@ -554,6 +566,34 @@ class TestCase(unittest.TestCase):
                 )
                 raise RuntimeError(msg)
 
+    def check_df(
+        self,
+        df: pd.DataFrame,
+        fuzzy_match: bool = False,
+        max_rows: int = 10000,
+    ) -> None:
+        """Check a dataframe against the golden outcome.
+
+        Dataframes with more than `max_rows` rows are checked through a hash
+        of their json string, so that the golden outcome stays small.
+
+        :param df: dataframe to check
+        :param fuzzy_match: ignore differences in spaces and end of lines
+        :param max_rows: max number of rows stored in full in the golden
+        """
+        actual = convert_df_to_json_string(df, n_head=None, n_tail=None)
+        if len(df) > max_rows:
+            # Hash the string as `_assert_equal()` would compare it.
+            if fuzzy_match:
+                actual = _remove_spaces(actual)
+            else:
+                actual = actual.rstrip("\n")
+            digest = hashlib.blake2b(
+                actual.encode("utf-8"), digest_size=16
+            ).hexdigest()
+            actual = "original shape=%s\nblake2b=%s" % (df.shape, digest)
+        self.check_string(actual, fuzzy_match=fuzzy_match)
+
     def _get_test_name(self) -> str:
         """
         :return: full test name as class.method.
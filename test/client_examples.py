@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import concurrent.futures as cfutur
 import os
 import pprint
 
@@ -32,24 +33,41 @@ print("P1_API_TOKEN=", P1_API_TOKEN)
 
 client = p1_edg.EdgarClient(token=P1_API_TOKEN)
 
-# Map Gvk to CIK and vice versa.
-print("# GvkCikMapper")
+# The mapper calls are independent, so send them at the same time and print
+# the results in order.
 gvk_mapper = edgar.mappers.GvkCikMapper(token=P1_API_TOKEN)
-print(
-    "result=%s" % gvk_mapper.get_gvk_from_cik(cik=940800, as_of_date="2007-01-18")
-)
-print(
-    "result=%s" % gvk_mapper.get_cik_from_gvk(gvk=61411, as_of_date="2007-01-18")
-)
-
-# Get an item mapper.
-print("# ItemMapper")
 item_mapper = edgar.mappers.ItemMapper(token=P1_API_TOKEN)
-print(
-    "result=%s"
-    % item_mapper.get_item_from_keywords(keywords="short-term short term")
-)
-print("result=%s" % item_mapper.get_mapping())
+with cfutur.ThreadPoolExecutor(max_workers=4) as executor:
+    mapper_futures = [
+        # Map Gvk to CIK and vice versa.
+        (
+            "GvkCikMapper",
+            executor.submit(
+                gvk_mapper.get_gvk_from_cik, cik=940800, as_of_date="2007-01-18"
+            ),
+        ),
+        (
+            "GvkCikMapper",
+            executor.submit(
+                gvk_mapper.get_cik_from_gvk, gvk=61411, as_of_date="2007-01-18"
+            ),
+        ),
+        # Get an item mapper.
+        (
+            "ItemMapper",
+            executor.submit(
+                item_mapper.get_item_from_keywords,
+                keywords="short-term short term",
+            ),
+        ),
+        ("ItemMapper", executor.submit(item_mapper.get_mapping)),
+    ]
+for mapper_name, future in mapper_futures:
+    print("# %s" % mapper_name)
+    print("result=%s" % future.result())
+
+# The payload calls share the progress bars and the spinner of the client, so
+# they run one after the other.
 
 # Get data for form 3, 4, 5.
 print("# Form 3, 4, 5")
@@ -1,6 +1,8 @@
 # This file contains only test tokens. You need to set yours.
 export P1_API_TOKEN='e44e7c6b04ef3ea1cfb7a8a67db74751c177259e'
 export P1_EDGAR_API_TOKEN='8c9c9458b145202c7a6b6cceaabd82023e957a46d6cf7061ed8e1c94a168f2fd'
+# Run also the tests that call the servers.
+export P1_RUN_LIVE_TESTS=1
 
 echo "P1_API_TOKEN=$P1_API_TOKEN"
 echo "P1_EDGAR_API_TOKEN=$P1_EDGAR_API_TOKEN"
@@ -1,24 +1,38 @@
+import functools
+
+import pytest
+
 import p1_data_client_python.helpers.git as git
 import p1_data_client_python.helpers.unit_test as hut
 
+# Each lookup walks the whole git tree, so resolve every notebook only once
+# per test session.
+_find_file_in_git_tree = functools.lru_cache(maxsize=None)(
+    git.find_file_in_git_tree
+)
+
+# Keep the notebooks on one pytest-xdist worker, so that they share the
+# lookups above.
+pytestmark = pytest.mark.xdist_group("notebooks")
+
 
 class TestP1DataApiExampleNotebook(hut.TestCase):
     def test_notebook1(self) -> None:
-        file_name = git.find_file_in_git_tree("p1_data_api_v1_example.ipynb")
+        file_name = _find_file_in_git_tree("p1_data_api_v1_example.ipynb")
         scratch_dir = self.get_scratch_space()
         hut.run_notebook(file_name, scratch_dir)
 
 
 class TestP1DataClientExampleNotebook(hut.TestCase):
     def test_notebook1(self) -> None:
-        file_name = git.find_file_in_git_tree("p1_data_client_example.ipynb")
+        file_name = _find_file_in_git_tree("p1_data_client_example.ipynb")
         scratch_dir = self.get_scratch_space()
         hut.run_notebook(file_name, scratch_dir)
 
 
 class TestP1EdgarDataClientExampleNotebook(hut.TestCase):
     def test_notebook1(self) -> None:
-        file_name = git.find_file_in_git_tree(
+        file_name = _find_file_in_git_tree(
             "p1_edgar_data_client_example.ipynb"
         )
         scratch_dir = self.get_scratch_space()
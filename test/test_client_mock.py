@@ -1,8 +1,11 @@
+import abc
+import json
 import unittest.mock as mock
 from typing import Any
 
 import pandas as pd
 
+import p1_data_client_python.abstract_client as p1_abs
 import p1_data_client_python.helpers.unit_test as hut
 import p1_data_client_python.client as p1_data
 import p1_data_client_python.exceptions as p1_exc
@@ -22,9 +25,23 @@ SEARCH_ROW_EXAMPLE = {
 }
 
 
-class SearchOnePageGoodResponse:
+class ResponseMock(abc.ABC):
     status_code = 200
 
+    @staticmethod
+    @abc.abstractmethod
+    def json() -> dict:
+        """
+        Return the payload of the response.
+        """
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self.json()).encode()
+
+
+class SearchOnePageGoodResponse(ResponseMock):
+
     @staticmethod
     def json() -> dict:
         return {
@@ -34,8 +51,7 @@ class SearchOnePageGoodResponse:
         }
 
 
-class PayloadGoodResponseMock:
-    status_code = 200
+class PayloadGoodResponseMock(ResponseMock):
 
     @staticmethod
     def json() -> dict:
@@ -57,16 +73,14 @@ class PayloadGoodResponseMock:
         }
 
 
-class MessyResponseMock:
-    status_code = 200
+class MessyResponseMock(ResponseMock):
 
     @staticmethod
     def json() -> dict:
         return {"message": "strange_message"}
 
 
-class MetaDataGoodResponseMock:
-    status_code = 200
+class MetaDataGoodResponseMock(ResponseMock):
 
     @staticmethod
     def json() -> dict:
@@ -78,6 +92,30 @@ class TestPythonClientMock(hut.TestCase):
         self.client = p1_data.Client(token="goo token")
         super().setUp()
 
+    def test_no_rate_limit_by_default(self) -> None:
+        self.assertIsNone(self.client._rate_limiter)
+
+    def test_invalid_rate_limit(self) -> None:
+        with self.assertRaises(ValueError):
+            p1_data.Client(token="goo token", requests_per_second=0)
+
+    def test_rate_limiter_below_one_rps(self) -> None:
+        clock = [0.0]
+        sleeps = []
+
+        def _sleep(secs: float) -> None:
+            sleeps.append(secs)
+            clock[0] += secs
+
+        limiter = p1_abs.RateLimiter(0.5)
+        with mock.patch("time.monotonic", lambda: clock[0]), mock.patch(
+            "time.sleep", _sleep
+        ):
+            for _ in range(3):
+                limiter.acquire()
+        # One request every 2 seconds.
+        self.assertEqual(sleeps, [2.0, 2.0])
+
     def test_list_of_metadata(self) -> None:
         self.assertIsInstance(self.client.list_of_metadata, list)
 
@@ -115,11 +153,11 @@ class TestPythonClientMock(hut.TestCase):
         with self.assertRaises(p1_exc.UnauthorizedException):
             self.client.get_metadata_type(EXAMPLE_METADATA_TYPE)
         # test on good response
-        mock_request.return_value = MetaDataGoodResponseMock
+        mock_request.return_value = MetaDataGoodResponseMock()
         self.assertIsInstance(
             self.client.get_metadata_type(EXAMPLE_METADATA_TYPE), pd.DataFrame
         )
         # test on ParseResponseException
-        mock_request.return_value = MessyResponseMock
+        mock_request.return_value = MessyResponseMock()
         with self.assertRaises(p1_exc.ParseResponseException):
             self.client.get_metadata_type(EXAMPLE_METADATA_TYPE)
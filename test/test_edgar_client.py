@@ -1,6 +1,9 @@
 import logging
 import os
 import pprint
+from typing import Any, Iterator
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -10,14 +13,69 @@ import p1_data_client_python.helpers.unit_test as phunit  # type: ignore
 import p1_data_client_python.edgar.utils as peutil
 
 _LOG = logging.getLogger(__name__)
-P1_API_TOKEN = os.environ["P1_EDGAR_API_TOKEN"]
-
 
+# Set `VCR_RECORD_MODE` (e.g., to "new_episodes") to record the HTTP traffic
+# of each test in `test/cassettes`, and to "none" to replay it without
+# network. This needs `vcrpy`.
+_VCR_RECORD_MODE = os.environ.get("VCR_RECORD_MODE")
+_CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+# Max number of values per column shown by `_get_df_info()`.
+_MAX_INFO_VALUES = 200
+
+
+@pytest.fixture(scope="session")
+def edgar_token() -> str:
+    """
+    Read the Edgar API token once, skipping the tests when it is not set.
+    """
+    token = os.environ.get("P1_EDGAR_API_TOKEN")
+    if not token and _VCR_RECORD_MODE == "none":
+        # The replayed requests don't need a real token.
+        token = "replay"
+    if not token:
+        pytest.skip("P1_EDGAR_API_TOKEN is not set")
+    return token
+
+
+@pytest.fixture(autouse=True)
+def _use_cassette(request: Any) -> Iterator[None]:
+    """
+    Record or replay the HTTP traffic of a test, if `VCR_RECORD_MODE` is set.
+    """
+    if _VCR_RECORD_MODE is None:
+        yield
+        return
+    import vcr  # type: ignore
+
+    file_name = f"{request.cls.__name__}.{request.node.name}.yaml"
+    with vcr.use_cassette(
+        os.path.join(_CASSETTE_DIR, file_name),
+        record_mode=_VCR_RECORD_MODE,
+        filter_headers=["authorization"],
+    ):
+        yield
+
+
+# Share a client, and so its connections, among the tests of a class. The
+# fixtures are module-level and applied with `usefixtures`, the pattern that
+# pytest supports for `unittest.TestCase` classes in all its versions.
+@pytest.fixture(scope="class")
+def _gvk_mapper(request: Any, edgar_token: str) -> None:
+    request.cls.gvk_mapper = p1cli.GvkCikMapper(token=edgar_token)
+
+
+@pytest.fixture(scope="class")
+def _item_mapper(request: Any, edgar_token: str) -> None:
+    request.cls.item_mapper = p1cli.ItemMapper(token=edgar_token)
+
+
+@pytest.fixture(scope="class")
+def _edgar_client(request: Any, edgar_token: str) -> None:
+    request.cls.client = p1cli.EdgarClient(token=edgar_token)
+
+
+@pytest.mark.usefixtures("_gvk_mapper")
 class TestGvkCikMapper(phunit.TestCase):
-    def setUp(self) -> None:
-        self.gvk_mapper = p1cli.GvkCikMapper(token=P1_API_TOKEN)
-        super().setUp()
-
     @pytest.mark.mappings
     def test_get_gvk_from_cik(self) -> None:
         """
@@ -27,10 +85,7 @@ class TestGvkCikMapper(phunit.TestCase):
                                                as_of_date="2007-01-01T00:00:00")
         self.assertIsInstance(gvk, pd.DataFrame)
         self.assertFalse(gvk.empty)
-        self.check_string(phunit.convert_df_to_json_string(gvk,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(gvk, fuzzy_match=True)
 
     @pytest.mark.mappings
     def test_get_cik_from_gvk(self) -> None:
@@ -41,17 +96,11 @@ class TestGvkCikMapper(phunit.TestCase):
                                                as_of_date="2007-03-14T00:00:00")
         self.assertIsInstance(cik, pd.DataFrame)
         self.assertFalse(cik.empty)
-        self.check_string(phunit.convert_df_to_json_string(cik,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(cik, fuzzy_match=True)
 
 
+@pytest.mark.usefixtures("_item_mapper")
 class TestItemMapper(phunit.TestCase):
-    def setUp(self) -> None:
-        self.item_mapper = p1cli.ItemMapper(token=P1_API_TOKEN)
-        super().setUp()
-
     @pytest.mark.mappings
     def test_get_item(self) -> None:
         """
@@ -62,10 +111,7 @@ class TestItemMapper(phunit.TestCase):
         )
         self.assertIsInstance(item, pd.DataFrame)
         self.assertFalse(item.empty)
-        self.check_string(phunit.convert_df_to_json_string(item,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          )
+        self.check_df(item)
 
     @pytest.mark.mappings
     def test_get_mapping(self) -> None:
@@ -75,17 +121,11 @@ class TestItemMapper(phunit.TestCase):
         mapping = self.item_mapper.get_mapping()
         self.assertIsInstance(mapping, pd.DataFrame)
         self.assertFalse(mapping.empty)
-        self.check_string(phunit.convert_df_to_json_string(mapping,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(mapping, fuzzy_match=True)
 
 
+@pytest.mark.usefixtures("_edgar_client")
 class TestEdgarClient(phunit.TestCase):
-    def setUp(self) -> None:
-        self.client = p1cli.EdgarClient(token=P1_API_TOKEN)
-        super().setUp()
-
     def _assert_date_columns_format(self, df: pd.DataFrame) -> None:
         """
         Assert that all values of date columns are timestamps.
@@ -157,11 +197,11 @@ class TestEdgarClient(phunit.TestCase):
             max_release_date="2016-01-26T00:00:00-05:00",
         )
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -187,11 +227,11 @@ class TestEdgarClient(phunit.TestCase):
         self.assertEqual(6, len(payload))
         self.assertEqual(8, len(payload["metadata"]))
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -219,11 +259,11 @@ class TestEdgarClient(phunit.TestCase):
             max_release_date="2021-03-04T00:00:00-05:00",
         )
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -249,11 +289,11 @@ class TestEdgarClient(phunit.TestCase):
         self.assertEqual(6, len(payload))
         self.assertEqual(15, len(payload["metadata"]))
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -281,11 +321,11 @@ class TestEdgarClient(phunit.TestCase):
             max_release_date="2016-01-26T00:00:00-05:00",
         )
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -313,11 +353,11 @@ class TestEdgarClient(phunit.TestCase):
             max_release_date="2021-03-05T00:00:00-05:00",
         )
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -345,11 +385,11 @@ class TestEdgarClient(phunit.TestCase):
             max_release_date="2021-03-04T00:00:00-05:00",
         )
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -375,11 +415,11 @@ class TestEdgarClient(phunit.TestCase):
         self.assertEqual(6, len(payload))
         self.assertEqual(17, len(payload["metadata"]))
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -413,11 +453,11 @@ class TestEdgarClient(phunit.TestCase):
         self.assertEqual(6, len(payload))
         self.assertEqual(372, len(payload["metadata"]))
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload.keys()=%s" % payload.keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload.keys()={payload.keys()}")
         for table_name, data in payload.items():
             actual.append(
-                f"payload[{table_name}]=" f"{pprint.pformat(data[:100])}"
+                f"payload[{table_name}]={pprint.pformat(data[:100])}"
             )
         actual = "\n".join(actual)
         self.check_string(actual, fuzzy_match=True)
@@ -476,11 +516,8 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self._log_df_info(payload)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.form8
     def test_form8_1_cik_1_item_knowledge_date_historical(self) -> None:
@@ -496,11 +533,8 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self._log_df_info(payload)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.form8
     def test_form8_no_cik_1_item(self) -> None:
@@ -515,10 +549,8 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None))
+        self._log_df_info(payload)
+        self.check_df(payload)
 
     @pytest.mark.form8
     def test_form8_only_1_cik(self) -> None:
@@ -528,11 +560,8 @@ class TestEdgarClient(phunit.TestCase):
         payload = self.client.get_form8_payload(cik=18498).head(586)
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self._log_df_info(payload)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.form8
     def test_form8_only_multi_cik(self) -> None:
@@ -542,11 +571,8 @@ class TestEdgarClient(phunit.TestCase):
         payload = self.client.get_form8_payload(cik=[18498, 319201, 5768]).head(1442)
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self._log_df_info(payload)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.form8
     def test_form8_multi_cik_1_item_knowledge_date_historical(self) -> None:
@@ -562,11 +588,8 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self._log_df_info(payload)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.form8
     def test_form8_invalid_cik(self) -> None:
@@ -582,10 +605,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertTrue(payload.empty)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.form8
     def test_form8_publication_date_filtering(self) -> None:
@@ -601,7 +621,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
+        self._log_df_info(payload)
         self.assertEqual(payload.shape[0], 822)
         self.assertGreaterEqual(
             pd.to_datetime(payload["filing_date"].min()),
@@ -626,7 +646,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
+        self._log_df_info(payload)
         self.assertEqual(payload.shape[0], 10)
         self.assertGreaterEqual(
             pd.to_datetime(payload["form_availability_timestamp"].min()),
@@ -651,7 +671,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
+        self._log_df_info(payload)
         missing_mask = payload["form_publication_timestamp"].isna()
         n_missing_publication_ts = payload[missing_mask].shape[0]
         # TODO(*): fix the behaviour in the #7524.
@@ -671,7 +691,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        _LOG.debug("info=\n%s", self._get_df_info(payload))
+        self._log_df_info(payload)
         dups_mask = payload.duplicated(subset=["gvk",
                                                "item_name",
                                                "period_of_report"],
@@ -724,10 +744,10 @@ class TestEdgarClient(phunit.TestCase):
         self.assertIsInstance(payload, list)
         self.assertEqual(len(payload), 1)
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload[0].keys()=%s" % payload[0].keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload[0].keys()={payload[0].keys()}")
         actual.append(
-            ('payload[0]["meta"]=\n%s' % pprint.pformat(payload[0]["meta"]))
+            f'payload[0]["meta"]=\n{pprint.pformat(payload[0]["meta"])}'
         )
         actual.append(pprint.pformat(payload[0]["data"])[:2000])
         actual = "\n".join(actual)
@@ -749,10 +769,10 @@ class TestEdgarClient(phunit.TestCase):
             del item['meta']['rt_form_processing_timestamp']
         self.assertIsInstance(payload, list)
         actual = []
-        actual.append(("len(payload)=%s" % len(payload)))
-        actual.append(("payload[0].keys()=%s" % payload[0].keys()))
+        actual.append(f"len(payload)={len(payload)}")
+        actual.append(f"payload[0].keys()={payload[0].keys()}")
         actual.append(
-            ('payload[0]["meta"]=\n%s' % pprint.pformat(payload[0]["meta"]))
+            f'payload[0]["meta"]=\n{pprint.pformat(payload[0]["meta"])}'
         )
         actual.append(pprint.pformat(payload[0]["data"])[:2000])
         actual = "\n".join(actual)
@@ -787,11 +807,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="publication_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                        n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_1_cik_knowledge_date_historical(self) -> None:
@@ -805,11 +821,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="knowledge_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_multi_cik_publication_date_historical(self) -> None:
@@ -823,12 +835,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode='publication_date'
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None,
-                                             n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_multi_cik_knowledge_date_historical(self) -> None:
@@ -842,11 +849,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode='knowledge_date'
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_cik_cusip_error(self) -> None:
@@ -868,12 +871,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="publication_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None,
-                                             n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_1_cusip_knowledge_date_historical(self) -> None:
@@ -887,11 +885,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="knowledge_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_multi_cusip_publication_date_historical(self) -> None:
@@ -905,11 +899,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="publication_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_multi_cusip_knowledge_date_real_time(self) -> None:
@@ -923,11 +913,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="knowledge_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_invalid_cusip(self) -> None:
@@ -941,11 +927,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="publication_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_no_cik_cusip_publication_date_historical(self) -> None:
@@ -960,11 +942,7 @@ class TestEdgarClient(phunit.TestCase):
         self.assertIsInstance(payload, dict)
         unique_uuids = payload["header_data"]["uuid"].unique()
         self.assertEqual(len(unique_uuids), 10)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_no_cik_cusip_publication_date_real_time(self) -> None:
@@ -979,11 +957,7 @@ class TestEdgarClient(phunit.TestCase):
         self.assertIsInstance(payload, dict)
         unique_uuids = payload["header_data"]["uuid"].unique()
         self.assertEqual(len(unique_uuids), 26)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_no_cik_cusip_knowledge_date_historical(self) -> None:
@@ -996,11 +970,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="knowledge_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_no_cik_cusip_knowledge_date_real_time(self) -> None:
@@ -1013,11 +983,7 @@ class TestEdgarClient(phunit.TestCase):
             date_mode="knowledge_date",
         )
         self.assertIsInstance(payload, dict)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_check_payload_december_gap(self) -> None:
@@ -1041,11 +1007,7 @@ class TestEdgarClient(phunit.TestCase):
         self.assertEqual(
             n_unique_uuids_metadata_processor, n_unique_uuids_api + 1
         )
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_no_cik_cusip_check_ciks(self) -> None:
@@ -1068,11 +1030,7 @@ class TestEdgarClient(phunit.TestCase):
                     714142, 1812178, 1767905, 1830922,
                     1800556, 1455530, 1841768, 1828929]
         self.assertCountEqual(unique_ciks, expected)
-        self.check_string(
-            phunit.convert_df_to_json_string(payload["information_table"],
-                                             n_head=None, n_tail=None),
-            fuzzy_match=True
-        )
+        self.check_df(payload["information_table"], fuzzy_match=True)
 
     @pytest.mark.form13
     def test_form13_exclusion_right_boundary(self) -> None:
@@ -1208,10 +1166,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.headers
     def test_headers_1_cik_knowledge_date_historical(self) -> None:
@@ -1227,10 +1182,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.headers
     def test_headers_multi_cik_publication_date_historical(self) -> None:
@@ -1246,10 +1198,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.headers
     def test_headers_multi_cik_knowledge_date_historical(self) -> None:
@@ -1265,10 +1214,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.headers
     def test_headers_no_cik(self) -> None:
@@ -1285,10 +1231,7 @@ class TestEdgarClient(phunit.TestCase):
         self.assertFalse(payload.empty)
         payload.sort_values(['form_type', 'filing_date', 'cik', 'uuid'],
                             inplace=True)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.headers
     def test_headers_1_form(self) -> None:
@@ -1304,10 +1247,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertEqual(payload.shape[0], 1)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.headers
     def test_headers_invalid_form_types(self) -> None:
@@ -1333,10 +1273,7 @@ class TestEdgarClient(phunit.TestCase):
         )
         self.assertIsInstance(payload, pd.DataFrame)
         self.assertFalse(payload.empty)
-        self.check_string(phunit.convert_df_to_json_string(payload,
-                                                           n_head=None,
-                                                           n_tail=None),
-                          fuzzy_match=True)
+        self.check_df(payload, fuzzy_match=True)
 
     @pytest.mark.headers
     def test_headers_length(self):
@@ -1398,10 +1335,24 @@ class TestEdgarClient(phunit.TestCase):
         self.assertEqual(df2.shape[0], 2968)
         self.assertTrue(df.equals(df2))
 
+    @classmethod
+    def _log_df_info(cls, df: pd.DataFrame) -> None:
+        # Skip computing the info when it's not logged.
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("info=\n%s", cls._get_df_info(df))
+
     @staticmethod
     def _get_df_info(df: pd.DataFrame) -> str:
         ret = []
         for col_name in ["ticker", "item_name", "filing_date"]:
-            vals = sorted(df[col_name].unique().astype(str))
-            ret.append("col_name=(%d) %s" % (len(vals), ", ".join(vals)))
+            # `np.unique()` returns the values sorted, so that the shown ones
+            # don't depend on the order of the rows.
+            uniques = np.unique(df[col_name].to_numpy().astype(str))
+            # Only format the first values, since payloads without dates can
+            # have many.
+            vals = uniques[:_MAX_INFO_VALUES]
+            ret.append(
+                f"col_name=({len(uniques)}, showing {len(vals)}) "
+                f"{', '.join(vals)}"
+            )
         return "\n".join(ret)
@@ -1,10 +1,22 @@
+import abc
+import gc
+import io
+import json
+import time
 import unittest.mock as mock
-from typing import Any
+import urllib.parse as uparse
+import weakref
+from typing import Any, Callable
 
 import pandas as pd
+import pytest
+import tqdm.auto as tauto
+import urllib3
 
 import p1_data_client_python.helpers.unit_test as hut
 import p1_data_client_python as p1cli
+import p1_data_client_python.edgar.edgar_client as peedga
+import p1_data_client_python.edgar.utils as peutil
 import p1_data_client_python.exceptions as p1_exc
 
 SEARCH_ROW_EXAMPLE = {
@@ -19,9 +31,22 @@ SEARCH_ROW_EXAMPLE = {
 }
 
 
-class PayloadGoodResponseMock:
+class ResponseMock(abc.ABC):
     status_code = 200
 
+    @staticmethod
+    @abc.abstractmethod
+    def json() -> dict:
+        """
+        Return the payload of the response.
+        """
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self.json()).encode()
+
+
+class PayloadGoodResponseMock(ResponseMock):
     @staticmethod
     def json() -> dict:
         return {
@@ -67,17 +92,68 @@ class PayloadGoodResponseMock:
         }
 
 
-class CikGoodResponseMock:
-    status_code = 200
-
+class CikGoodResponseMock(ResponseMock):
     @staticmethod
     def json() -> dict:
         return {"data": ["123"]}
 
 
-class MessyResponseMock:
-    status_code = 200
+class GvkGoodResponseMock(ResponseMock):
+    @staticmethod
+    def json() -> dict:
+        return {
+            "data": [
+                {
+                    "cik": "0000033115",
+                    "effdate": "2006-04-28T00:00:00",
+                    "thrudate": "2007-11-14T23:59:59",
+                    "gvk": "004416",
+                },
+            ]
+        }
+
 
+class GvkMultiCikResponseMock(ResponseMock):
+    @staticmethod
+    def json() -> dict:
+        # Several GVKs per CIK, not sorted by date.
+        return {
+            "data": [
+                {
+                    "cik": "0000033115",
+                    "effdate": "2007-11-15T00:00:00",
+                    "thrudate": "2020-01-01T23:59:59",
+                    "gvk": "004417",
+                },
+                {
+                    "cik": "0000000123",
+                    "effdate": "2010-01-01T00:00:00",
+                    "thrudate": "2020-01-01T23:59:59",
+                    "gvk": "000002",
+                },
+                {
+                    "cik": "0000033115",
+                    "effdate": "2006-04-28T00:00:00",
+                    "thrudate": "2007-11-14T23:59:59",
+                    "gvk": "004416",
+                },
+                {
+                    "cik": "0000000123",
+                    "effdate": "2012-01-01T00:00:00",
+                    "thrudate": "2021-01-01T23:59:59",
+                    "gvk": "000003",
+                },
+                {
+                    "cik": "0000000123",
+                    "effdate": "2001-01-01T00:00:00",
+                    "thrudate": "2009-12-31T23:59:59",
+                    "gvk": "000001",
+                },
+            ]
+        }
+
+
+class MessyResponseMock(ResponseMock):
     @staticmethod
     def json() -> dict:
         return {"message": "strange_message"}
@@ -97,6 +173,27 @@ class TestEdgarPythonClientMock(hut.TestCase):
         # test on good response
         mock_request.return_value = PayloadGoodResponseMock()
         self.assertIsInstance(self.client.get_form8_payload(123), pd.DataFrame)
+        # test on ParseResponseException
+        mock_request.return_value = MessyResponseMock()
+        with self.assertRaises(p1_exc.ParseResponseException):
+            self.client.get_form8_payload(123)
+
+    @mock.patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_throttled_after_retries(self, mock_request: Any) -> None:
+        mock_request.side_effect = lambda *args, **kwargs: (
+            urllib3.response.HTTPResponse(
+                body=io.BytesIO(b"Too many requests"),
+                status=429,
+                preload_content=False,
+            )
+        )
+        client = p1cli.EdgarClient(
+            token="goo token", retries_number=2, backoff_factor=0
+        )
+        # The last throttled response is mapped to the client's exception.
+        with self.assertRaises(p1_exc.ParseResponseException):
+            client.get_form8_payload(123)
+        self.assertEqual(3, mock_request.call_count)
 
     @mock.patch("requests.Session.request")
     def test_get_cik_(self, mock_request: Any) -> None:
@@ -109,3 +206,319 @@ class TestEdgarPythonClientMock(hut.TestCase):
         self.assertIsInstance(
             self.client.get_cik(gvk=123, gvk_date="2020-01-01"), pd.DataFrame,
         )
+        # The same lookup is served from the cache.
+        call_count = mock_request.call_count
+        self.client.get_cik(gvk=123, gvk_date="2020-01-01")
+        self.assertEqual(call_count, mock_request.call_count)
+
+    @mock.patch("requests.Session.request")
+    def test_get_cik_cache_per_client(self, mock_request: Any) -> None:
+        mock_request.return_value = CikGoodResponseMock()
+        client = p1cli.EdgarClient(token="goo token")
+        client.get_cik(gvk=123, gvk_date="2020-01-01")
+        # Another client doesn't share the cache.
+        self.client.get_cik(gvk=123, gvk_date="2020-01-01")
+        self.assertEqual(2, mock_request.call_count)
+        # The cache doesn't keep the client alive.
+        client_ref = weakref.ref(client)
+        del client
+        gc.collect()
+        self.assertIsNone(client_ref())
+
+    @mock.patch("requests.Session.request")
+    def test_prefetch_gvk_cik_mapping(self, mock_request: Any) -> None:
+        mock_request.return_value = GvkGoodResponseMock()
+        self.client.prefetch_gvk_cik_mapping([33115, 123])
+        self.assertEqual(1, mock_request.call_count)
+        self.assertEqual({33115: 4416, 123: None}, self.client.cik_gvk_mapping)
+        # Cached CIKs don't hit the server again.
+        self.assertEqual(4416, self.client.get_gvk_cached(33115))
+        self.assertIsNone(self.client.get_gvk_cached(123))
+        self.assertEqual(1, mock_request.call_count)
+
+    @mock.patch("requests.Session.request")
+    def test_prefetch_gvk_cik_mapping_latest_gvk(
+        self, mock_request: Any
+    ) -> None:
+        mock_request.return_value = GvkMultiCikResponseMock()
+        self.client.prefetch_gvk_cik_mapping([33115, 123, 456])
+        # All the CIKs go in one request.
+        self.assertEqual(1, mock_request.call_count)
+        self.assertEqual(
+            [123, 456, 33115], mock_request.call_args[1]["params"]["cik"]
+        )
+        # Each CIK maps to the GVK with the latest `effdate`.
+        self.assertEqual(
+            {33115: 4417, 123: 3, 456: None}, self.client.cik_gvk_mapping
+        )
+
+    @mock.patch("requests.Session.request")
+    def test_payload_multiple_pages(self, mock_request: Any) -> None:
+        data = PayloadGoodResponseMock.json()
+        first_page = dict(data)
+        first_page["links"] = dict(
+            data["links"],
+            next="http://data.particle.one/edgar/v0/data/form8?offset=2",
+        )
+        first_page["count"] = 4
+        second_page = dict(data, count=4)
+        mock_request.side_effect = [
+            mock.Mock(status_code=200, content=json.dumps(first_page)),
+            mock.Mock(status_code=200, content=json.dumps(second_page)),
+        ]
+        payload = self.client.get_form8_payload(123)
+        self.assertEqual(2, mock_request.call_count)
+        self.assertEqual(4, len(payload))
+        self.assertEqual(list(range(4)), list(payload.index))
+
+    @mock.patch("tqdm.auto.tqdm", wraps=tauto.tqdm)
+    @mock.patch("requests.Session.request")
+    def test_form4_progress_bar_total(
+        self, mock_request: Any, mock_tqdm: Any
+    ) -> None:
+        # Form 4 pages are dicts of tables, and have 100 records each.
+        url = "http://data.particle.one/edgar/v0/data/form4?cik=123"
+        page = {
+            "links": {"self": f"{url}&offset=0", "next": f"{url}&offset=100"},
+            "count": 250,
+            "data": {"metadata": [{"a": 1}], "footnotes": [{"b": 2}]},
+        }
+        mock_request.return_value = mock.Mock(
+            status_code=200, content=json.dumps(page)
+        )
+        self.client.get_form4_payload(cik=123)
+        self.assertEqual(3, mock_request.call_count)
+        totals = [
+            call[1]["total"]
+            for call in mock_tqdm.call_args_list
+            if call[1].get("desc") == "Pages: "
+        ]
+        self.assertEqual([3], totals)
+
+    @staticmethod
+    def _get_offset_page(count: int, page_size: int) -> Callable:
+        """
+        Build a mock answering the pages of a Form 4 payload by offset.
+
+        Each page holds its offset in the "page" table.
+        """
+        url = "http://data.particle.one/edgar/v0/data/form4?cik=123"
+
+        def _request(*args: Any, **kwargs: Any) -> mock.Mock:
+            page_url = kwargs["url"] if "url" in kwargs else args[1]
+            query = uparse.urlparse(page_url).query
+            offset = int(uparse.parse_qs(query).get("offset", [0])[0])
+            page = {
+                "links": {
+                    "self": f"{url}&offset={offset}",
+                    "next": f"{url}&offset={offset + page_size}",
+                },
+                "count": count,
+                "data": {"page": [{"offset": offset}]},
+            }
+            return mock.Mock(status_code=200, content=json.dumps(page))
+
+        return _request
+
+    @mock.patch("requests.Session.request")
+    def test_payload_pages_in_order(self, mock_request: Any) -> None:
+        mock_request.side_effect = self._get_offset_page(1000, 100)
+        client = p1cli.EdgarClient(token="goo token", max_concurrent_requests=3)
+        pages = list(client.iter_form4_payload(cik=123))
+        self.assertEqual(10, mock_request.call_count)
+        self.assertEqual(
+            list(range(0, 1000, 100)),
+            [page["page"][0]["offset"] for page in pages],
+        )
+
+    @mock.patch("requests.Session.request")
+    def test_iter_form4_payload_lazy(self, mock_request: Any) -> None:
+        mock_request.side_effect = self._get_offset_page(1000, 100)
+        client = p1cli.EdgarClient(token="goo token", max_concurrent_requests=2)
+        pages = client.iter_form4_payload(cik=123)
+        self.assertEqual(0, mock_request.call_count)
+        # The first page is requested alone.
+        next(pages)
+        self.assertLessEqual(
+            mock_request.call_count, client.max_concurrent_requests
+        )
+        # Then at most `max_concurrent_requests` pages are ahead of the
+        # consumed ones, even when the consumer is slow.
+        next(pages)
+        time.sleep(0.2)
+        self.assertLessEqual(
+            mock_request.call_count, 2 + client.max_concurrent_requests
+        )
+        self.assertEqual(8, len(list(pages)))
+        self.assertEqual(10, mock_request.call_count)
+
+    @mock.patch("requests.Session.request")
+    def test_payload_follow_links(self, mock_request: Any) -> None:
+        data = PayloadGoodResponseMock.json()
+        del data["count"]
+        next_url = "http://data.particle.one/edgar/v0/data/form8?cursor=abc"
+        first_page = dict(data, links=dict(data["links"], next=next_url))
+        # The second page is short, so its next link is not followed.
+        second_page = dict(first_page, data=data["data"][:1])
+        mock_request.side_effect = [
+            mock.Mock(status_code=200, content=json.dumps(first_page)),
+            mock.Mock(status_code=200, content=json.dumps(second_page)),
+        ]
+        payload = self.client.get_form8_payload(123)
+        self.assertEqual(2, mock_request.call_count)
+        self.assertEqual(3, len(payload))
+
+    @mock.patch("requests.Session.request")
+    def test_payload_follow_links_multi_page(self, mock_request: Any) -> None:
+        data = PayloadGoodResponseMock.json()
+        del data["count"]
+        next_url = "http://data.particle.one/edgar/v0/data/form8?cursor=abc"
+        full_page = dict(data, links=dict(data["links"], next=next_url))
+        last_page = dict(full_page, data=data["data"][:1])
+        mock_request.side_effect = [
+            mock.Mock(status_code=200, content=json.dumps(full_page)),
+            mock.Mock(status_code=200, content=json.dumps(full_page)),
+            mock.Mock(status_code=200, content=json.dumps(last_page)),
+        ]
+        payload = self.client.get_form8_payload(123)
+        self.assertEqual(3, mock_request.call_count)
+        self.assertEqual(5, len(payload))
+
+    @mock.patch("requests.Session.request")
+    def test_payload_empty(self, mock_request: Any) -> None:
+        empty_page = dict(PayloadGoodResponseMock.json(), count=0, data=[])
+        mock_request.return_value = mock.Mock(
+            status_code=200, content=json.dumps(empty_page)
+        )
+        payload = self.client.get_form8_payload(123)
+        self.assertTrue(payload.empty)
+
+    @mock.patch("requests.Session.request")
+    def test_payload_mixed_fields(self, mock_request: Any) -> None:
+        records = PayloadGoodResponseMock.json()["data"]
+        # The first record misses a field that the second one has.
+        page = dict(
+            PayloadGoodResponseMock.json(),
+            data=[records[0], dict(records[1], extra_field="x")],
+        )
+        mock_request.return_value = mock.Mock(
+            status_code=200, content=json.dumps(page)
+        )
+        payload = self.client.get_form8_payload(123)
+        self.assertIn("extra_field", payload.columns)
+        self.assertEqual(2, len(payload))
+
+    @mock.patch("requests.Session.request")
+    def test_payload_numpy_nullable_dtypes(self, mock_request: Any) -> None:
+        mock_request.return_value = PayloadGoodResponseMock()
+        payload = self.client.get_form8_payload(
+            123, dtype_backend="numpy_nullable"
+        )
+        self.assertEqual("Int64", payload["cik"].dtype)
+        self.assertEqual("Float64", payload["item_value"].dtype)
+
+    @mock.patch("requests.Session.request")
+    def test_payload_pyarrow_dtypes(self, mock_request: Any) -> None:
+        pytest.importorskip("pyarrow")
+        mock_request.return_value = PayloadGoodResponseMock()
+        payload = self.client.get_form8_payload(123, dtype_backend="pyarrow")
+        self.assertIsInstance(payload["cik"].dtype, pd.ArrowDtype)
+        self.assertIsInstance(payload["item_value"].dtype, pd.ArrowDtype)
+
+    @mock.patch("requests.Session.request")
+    def test_payload_pyarrow_mixed_types(self, mock_request: Any) -> None:
+        pytest.importorskip("pyarrow")
+        records = PayloadGoodResponseMock.json()["data"]
+        page = dict(
+            PayloadGoodResponseMock.json(),
+            data=[dict(records[0], item_value=""), records[1]],
+        )
+        mock_request.return_value = mock.Mock(
+            status_code=200, content=json.dumps(page)
+        )
+        with self.assertRaises(p1_exc.ParseResponseException):
+            self.client.get_form8_payload(123, dtype_backend="pyarrow")
+
+    def test_payload_invalid_dtype_backend(self) -> None:
+        with self.assertRaises(AssertionError):
+            self.client.get_form8_payload(123, dtype_backend="numpy")
+        # The dtype backends are not available before pandas 2.0.
+        with mock.patch.object(peedga, "_PANDAS_MAJOR_VERSION", 1):
+            with self.assertRaises(AssertionError):
+                self.client.get_form8_payload(
+                    123, dtype_backend="numpy_nullable"
+                )
+
+    @mock.patch("requests.Session.request")
+    def test_payload_page_size(self, mock_request: Any) -> None:
+        mock_request.return_value = PayloadGoodResponseMock()
+        client = p1cli.EdgarClient(token="goo token", page_size=1000)
+        client.get_form8_payload(123)
+        self.assertEqual(1000, mock_request.call_args[1]["params"]["limit"])
+
+    @mock.patch("requests.Session.request")
+    def test_iter_form4_payload(self, mock_request: Any) -> None:
+        page = dict(
+            PayloadGoodResponseMock.json(),
+            data={"table": [{"a": 1}, {"a": 2}]},
+        )
+        mock_request.return_value = mock.Mock(
+            status_code=200, content=json.dumps(page)
+        )
+        pages = list(self.client.iter_form4_payload(cik=123))
+        self.assertEqual([{"table": [{"a": 1}, {"a": 2}]}], pages)
+
+    @mock.patch("requests.Session.request")
+    def test_form_headers_mixed_fields(self, mock_request: Any) -> None:
+        # Headers of different form types have different fields.
+        page = dict(
+            PayloadGoodResponseMock.json(),
+            data=[{"form_type": "4"}, {"form_type": "8-K", "item": "2.02"}],
+        )
+        mock_request.return_value = mock.Mock(
+            status_code=200, content=json.dumps(page)
+        )
+        headers = self.client.get_form_headers(form_type="4", cik=123)
+        self.assertEqual(["form_type", "item"], list(headers.columns))
+
+    def test_rate_limit_opt_in(self) -> None:
+        self.assertIsNone(self.client._rate_limiter)
+        client = p1cli.EdgarClient(token="goo token", requests_per_second=10)
+        self.assertEqual(10, client._rate_limiter.rps)
+
+    def test_form_types_copy(self) -> None:
+        self.client.form_types.append("X")
+        self.assertNotIn("X", self.client.form_types)
+        self.assertNotIn("X", p1cli.EdgarClient(token="goo token").form_types)
+
+    def test_form_4_13_10_output_mixed_fields(self) -> None:
+        output = {"table": [{"a": 1}, {"a": 2, "b": 3}]}
+        tables = self.client._process_form_4_13_10_output(output)
+        self.assertEqual(["a", "b"], list(tables["table"].columns))
+
+
+class TestGetPageUrls(hut.TestCase):
+    def test_offsets(self) -> None:
+        links = peutil.Links(
+            {
+                "self": "http://host/data/form8?cik=1&offset=0",
+                "next": "http://host/data/form8?cik=1&offset=100",
+            }
+        )
+        page_urls = peutil.get_page_urls(links, count=250)
+        self.assertEqual(
+            [
+                "http://host/data/form8?cik=1&offset=100",
+                "http://host/data/form8?cik=1&offset=200",
+            ],
+            page_urls,
+        )
+
+    def test_no_offset(self) -> None:
+        links = peutil.Links(
+            {
+                "self": "http://host/data/form8?cik=1",
+                "next": "http://host/data/form8?cik=1&cursor=abc",
+            }
+        )
+        self.assertIsNone(peutil.get_page_urls(links, count=250))